@@ -1,20 +1,35 @@
 import os
 import sys
 import toml
-import subprocess
-from urllib.request import urlretrieve
-import tempfile
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+import hashlib
+import json
+import time
+import importlib.util
+import functools
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFrame,
-                               QPushButton, QLabel, QSlider, QCheckBox, QRadioButton, QToolTip,
-                               QLineEdit, QGroupBox, QStackedWidget, QMessageBox, QGridLayout, QStyle,
-                               QComboBox, QToolButton, QSpinBox, QDoubleSpinBox, QScrollArea, QFormLayout, QListWidget)
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QMovie, QIcon, QFontMetrics, QFont
-
+                               QPushButton, QLabel, QSlider, QCheckBox, QToolTip,
+                               QLineEdit, QGroupBox, QMessageBox, QGridLayout, QStyle,
+                               QComboBox, QToolButton, QSpinBox, QDoubleSpinBox, QScrollArea, QFormLayout, QListWidget,
+                               QProgressBar, QPlainTextEdit)
+from PySide6.QtCore import (Qt, QSize, QPropertyAnimation, QEasingCurve, QProcess, QStringListModel, QTimer, QUrl,
+                            QStandardPaths, QBuffer, QByteArray)
+from PySide6.QtGui import QMovie, QIcon, QFontMetrics, QFont, QPixmapCache, QPainter, QColor, QTextCursor
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+@functools.cache
 def find_config_file():
     try:
-        import Sports2D
-        package_dir = os.path.dirname(Sports2D.__file__)
+        # Locate the package without importing it: Sports2D's __init__ pulls in heavy dependencies
+        spec = importlib.util.find_spec("Sports2D")
+        if spec is not None and spec.origin:
+            package_dir = os.path.dirname(spec.origin)
+        else:
+            import Sports2D
+            package_dir = os.path.dirname(Sports2D.__file__)
         config_path = os.path.join(package_dir, 'Demo', 'Config_demo.toml')
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found at {config_path}")
@@ -32,6 +47,9 @@ class CollapsibleGroupBox(QWidget):
         self.animation = QPropertyAnimation(self, b"maximumHeight")
         self.animation.setDuration(300)
         self.animation.setEasingCurve(QEasingCurve.InOutQuart)
+        self.animation.finished.connect(self.set_content_height)
+        # Set SPORTS2D_NO_ANIM to resize sections instantly instead of animating every frame
+        self.animated = not os.environ.get("SPORTS2D_NO_ANIM")
 
         self.toggle_button = QPushButton(title)
         self.toggle_button.setStyleSheet("""
@@ -49,15 +67,23 @@ class CollapsibleGroupBox(QWidget):
                 background-color: #34495E;
             }
         """)
-        self.toggle_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowRight))
+        # Arrow icons are looked up once and shared by every group box
+        if not hasattr(CollapsibleGroupBox, '_ICON_RIGHT'):
+            style = self.style()
+            CollapsibleGroupBox._ICON_RIGHT = style.standardIcon(QStyle.SP_ArrowRight)
+            CollapsibleGroupBox._ICON_DOWN = style.standardIcon(QStyle.SP_ArrowDown)
+        self.toggle_button.setIcon(CollapsibleGroupBox._ICON_RIGHT)
         self.toggle_button.clicked.connect(self.toggle_content)
 
         self.content_area = QWidget()
+        self.content_area.setObjectName("collapsibleContent")
         self.content_area.setMaximumHeight(0)
         self.content_area.setStyleSheet("""
-            background-color: #34495E;
-            border-radius: 5px;
-            padding: 5px;
+            #collapsibleContent {
+                background-color: #34495E;
+                border-radius: 5px;
+                padding: 5px;
+            }
         """)
 
         self.main_layout = QVBoxLayout(self)
@@ -86,8 +112,11 @@ class CollapsibleGroupBox(QWidget):
         self.animation.setStartValue(start_height)
         self.animation.setEndValue(end_height)
         self.content_area.setMaximumHeight(self.content_height)
-        self.animation.start()
-        self.toggle_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowDown))
+        if self.animated:
+            self.animation.start()
+        else:
+            self.setMaximumHeight(end_height)
+        self.toggle_button.setIcon(CollapsibleGroupBox._ICON_DOWN)
 
     def collapse(self):
         self.is_collapsed = True
@@ -96,9 +125,12 @@ class CollapsibleGroupBox(QWidget):
         
         self.animation.setStartValue(start_height)
         self.animation.setEndValue(end_height)
-        self.animation.start()
-        self.toggle_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowRight))
-        self.animation.finished.connect(self.set_content_height)
+        if self.animated:
+            self.animation.start()
+        else:
+            self.setMaximumHeight(end_height)
+            self.set_content_height()
+        self.toggle_button.setIcon(CollapsibleGroupBox._ICON_RIGHT)
 
     def set_content_height(self):
         if self.is_collapsed:
@@ -112,72 +144,83 @@ class CollapsibleGroupBox(QWidget):
                      self.minimumSizeHint().height() + (0 if self.is_collapsed else self.content_height))
 
 class SettingsPanel(QWidget):
+    _TOOLTIPS = {
+        "show_plots": "Plot the results.",
+        "filter": "Apply a filter to the data.",
+        "show_angles_on_img": "Display angles on the image.",
+        "show_angles_on_vid": "Display angles on the video.",
+        "flip_left_right": "Same angles whether the participant faces left/right. Uncheck for continuous timeseries when participant switches stance."
+    }
+    _FILTER_TYPES = ("butterworth", "gaussian", "LOESS", "median")
+    _POSE_MODES = ("lightweight", "balanced", "performance")
+    _shared_models = {}
+
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
         self.config_path = find_config_file()
         self.config_data = self.load_config()
         self.set_styles()
-        self.tooltips = {
-            "show_plots": "Plot the results.",
-            "filter": "Apply a filter to the data.",
-            "show_angles_on_img": "Display angles on the image.",
-            "show_angles_on_vid": "Display angles on the video.",
-            "flip_left_right": "Same angles whether the participant faces left/right./n" "Set it to false if you want timeseries to be continuous even when the participent switches their stance."
-        }
         self.setup_ui()
 
 
 
     def load_config(self):
-        return toml.load(self.config_path)
+        # The panel is built once per session, so the small TOML file is parsed only once
+        with open(self.config_path, 'rb', buffering=65536) as f:
+            return tomllib.load(f)
 
     def setup_ui(self):
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(20)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(20)
-
-        # Basic Settings
-        basic_group = CollapsibleGroupBox("Basic Settings")
-        self.setup_basic_settings(basic_group)
-        scroll_layout.addWidget(basic_group)
-
-        # Advanced Pose Settings
-        advanced_pose_group = CollapsibleGroupBox("Advanced Pose Settings")
-        self.setup_advanced_pose_settings(advanced_pose_group)
-        scroll_layout.addWidget(advanced_pose_group)
-
-        # Advanced Angles Settings
-        advanced_angles_group = CollapsibleGroupBox("Advanced Angles Settings")
-        self.setup_advanced_angles_settings(advanced_angles_group)
-        scroll_layout.addWidget(advanced_angles_group)
-
-        scroll_layout.addStretch(1)
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
-
-        # Bottom buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
-        
-        apply_button = self.create_styled_button("Apply", "#2980B9", self.apply_settings)
-        apply_button.setFixedSize(100, 40)
-
-        back_button = self.create_styled_button("Back", "#34495E", self.main_window.show_main_panel)
-        back_button.setFixedSize(100, 40)
-
-        button_layout.addStretch()
-        button_layout.addWidget(apply_button)
-        button_layout.addWidget(back_button)
-        main_layout.addLayout(button_layout)
+        # Build the whole panel without intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            main_layout = QVBoxLayout(self)
+            main_layout.setContentsMargins(20, 20, 20, 20)
+            main_layout.setSpacing(20)
+
+            scroll_area = QScrollArea()
+            scroll_area.setWidgetResizable(True)
+            scroll_area.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
+
+            scroll_content = QWidget()
+            scroll_layout = QVBoxLayout(scroll_content)
+            scroll_layout.setSpacing(20)
+
+            # Basic Settings
+            basic_group = CollapsibleGroupBox("Basic Settings")
+            self.setup_basic_settings(basic_group)
+            scroll_layout.addWidget(basic_group)
+
+            # Advanced Pose Settings
+            advanced_pose_group = CollapsibleGroupBox("Advanced Pose Settings")
+            self.setup_advanced_pose_settings(advanced_pose_group)
+            scroll_layout.addWidget(advanced_pose_group)
+
+            # Advanced Angles Settings
+            advanced_angles_group = CollapsibleGroupBox("Advanced Angles Settings")
+            self.setup_advanced_angles_settings(advanced_angles_group)
+            scroll_layout.addWidget(advanced_angles_group)
+
+            scroll_layout.addStretch(1)
+            scroll_area.setWidget(scroll_content)
+            main_layout.addWidget(scroll_area)
+
+            # Bottom buttons
+            button_layout = QHBoxLayout()
+            button_layout.setSpacing(10)
+
+            apply_button = self.create_styled_button("Apply", "apply", self.apply_settings)
+            apply_button.setFixedSize(100, 40)
+
+            back_button = self.create_styled_button("Back", "back", self.main_window.show_main_panel)
+            back_button.setFixedSize(100, 40)
+
+            button_layout.addStretch()
+            button_layout.addWidget(apply_button)
+            button_layout.addWidget(back_button)
+            main_layout.addLayout(button_layout)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setup_basic_settings(self, group):
         layout = QVBoxLayout()
@@ -185,14 +228,12 @@ class SettingsPanel(QWidget):
 
         # Display Detection
         self.display_detection_checkbox = QCheckBox("Display Detection")
-        self.display_detection_checkbox.setStyleSheet(self.font_adjustment())
         self.display_detection_checkbox.setChecked(self.config_data['pose']['display_detection'])
         self.display_detection_checkbox.setToolTip("Show processing of the pose detection.")
         layout.addWidget(self.display_detection_checkbox)
 
         # Time Range
         time_range_label = QLabel("Time Range:")
-        time_range_label.setStyleSheet(self.font_adjustment())
         time_range_label.setToolTip("Set the time range for the analysis.")
         layout.addWidget(time_range_label)
 
@@ -200,163 +241,176 @@ class SettingsPanel(QWidget):
         self.time_range_start = QLineEdit(str(self.config_data['pose']['time_range'][0]) if self.config_data['pose']['time_range'] else "")
         self.time_range_end = QLineEdit(str(self.config_data['pose']['time_range'][1]) if self.config_data['pose']['time_range'] else "")
         for widget in (self.time_range_start, self.time_range_end):
-            widget.setStyleSheet(self.lineedit_style())
             widget.setToolTip("Enter the start/end time for analysis (in seconds)")
         time_range_layout.addWidget(self.time_range_start)
-        time_range_layout.addWidget(QLabel("-", styleSheet="color: white;"))
+        time_range_layout.addWidget(QLabel("-"))
         time_range_layout.addWidget(self.time_range_end)
         layout.addLayout(time_range_layout)
 
         # Joint Angles
         joint_angles_label = QLabel("Select Joint Angles:")
-        joint_angles_label.setStyleSheet(self.font_adjustment())
         joint_angles_label.setToolTip("Choose the joint angles you want to compute")
         layout.addWidget(joint_angles_label)
 
         self.joint_angles_list = QListWidget()
-        self.joint_angles_list.setStyleSheet(self.listwidget_style())
         self.joint_angles_list.setSelectionMode(QListWidget.MultiSelection)
-        self.joint_angles_list.addItems([
+        self._joint_names = [
             'Right ankle', 'Left ankle', 'Right knee', 'Left knee', 'Right hip',
             'Left hip', 'Right shoulder', 'Left shoulder', 'Right elbow', 'Left elbow',
             'Right wrist', 'Left wrist'
-        ])
-        for i in range(self.joint_angles_list.count()):
-            item = self.joint_angles_list.item(i)
-            if item.text() in self.config_data['compute_angles']['joint_angles']:
-                item.setSelected(True)
+        ]
+        self.joint_angles_list.addItems(self._joint_names)
+        self.select_list_items(self.joint_angles_list, self.config_data['compute_angles']['joint_angles'])
         layout.addWidget(self.joint_angles_list)
 
         # Segment Angles
         segment_angles_label = QLabel("Select Segment Angles:")
-        segment_angles_label.setStyleSheet(self.font_adjustment())
         segment_angles_label.setToolTip("Choose the segment angles you want to compute")
         layout.addWidget(segment_angles_label)
 
         self.segment_angles_list = QListWidget()
-        self.segment_angles_list.setStyleSheet(self.listwidget_style())
         self.segment_angles_list.setSelectionMode(QListWidget.MultiSelection)
-        self.segment_angles_list.addItems([
+        self._segment_names = [
             'Right foot', 'Left foot', 'Right shank', 'Left shank', 'Right thigh',
             'Left thigh', 'Trunk', 'Right arm', 'Left arm', 'Right forearm',
             'Left forearm', 'Right hand', 'Left hand'
-        ])
-        for i in range(self.segment_angles_list.count()):
-            item = self.segment_angles_list.item(i)
-            if item.text() in self.config_data['compute_angles']['segment_angles']:
-                item.setSelected(True)
+        ]
+        self.segment_angles_list.addItems(self._segment_names)
+        self.select_list_items(self.segment_angles_list, self.config_data['compute_angles']['segment_angles'])
         layout.addWidget(self.segment_angles_list)
 
         group.content_layout.addLayout(layout)
 
+    @staticmethod
+    def select_list_items(list_widget, names):
+        # Select saved entries in one pass: one repaint and no itemSelectionChanged per item
+        selected = frozenset(names)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            for i in range(list_widget.count()):
+                item = list_widget.item(i)
+                if item.text() in selected:
+                    item.setSelected(True)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+
     def setup_advanced_pose_settings(self, group):
         layout = QFormLayout()
         layout.setVerticalSpacing(10)
+        layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        rows = []
 
-        # Overwrite Pose
-        self.overwrite_pose = QCheckBox("Overwrite existing pose data")
-        self.overwrite_pose.setStyleSheet(self.font_adjustment())
-        self.overwrite_pose.setChecked(self.config_data['pose_advanced']['overwrite_pose'])
-        self.overwrite_pose.setToolTip("If unchecked, don't run pose detection again if JSON pose files are found.")
-        layout.addRow(self.overwrite_pose)
-
-        # Webcam ID
-        self.webcam_id = QSpinBox()
-        self.webcam_id.setStyleSheet(self.spinbox_style())
-        self.webcam_id.setValue(self.config_data['pose_advanced']['webcam_id'])
-        self.webcam_id.setToolTip("Set your webcam ID (0 is default)")
-        layout.addRow(self.create_label("Webcam ID:"), self.webcam_id)
-
-        # Input Size
-        input_size_layout = QHBoxLayout()
-        self.input_width = QSpinBox()
-        self.input_height = QSpinBox()
-        self.auto_checkbox = QCheckBox("Auto")
-        self.auto_checkbox.setStyleSheet(self.font_adjustment() + "padding-left: 20px;")
-
-        for spinbox in (self.input_width, self.input_height):
-            spinbox.setRange(1, 10000)
-            spinbox.setStyleSheet(self.spinbox_style())
-            spinbox.setToolTip("For only webcam, set the input size of the webcam.\n"
-                                "If 'Auto' is selected, input size will be set to 'auto'. Otherwise, specify the size manually.")
-        current_input_size = self.config_data['pose_advanced']['input_size']
-
-        # 설정된 값이 'auto'라면 체크박스를 선택 상태로 만듦
-        if current_input_size == "auto":
-            self.auto_checkbox.setChecked(True)
-            self.input_width.setEnabled(False)
-            self.input_height.setEnabled(False)
-        else:
-            self.input_width.setValue(current_input_size[0])
-            self.input_height.setValue(current_input_size[1])
-            self.auto_checkbox.setChecked(False)
-
-        input_size_layout.addWidget(QLabel("Width:"))
-        input_size_layout.addWidget(self.input_width)
-        input_size_layout.addWidget(QLabel("Height:"))
-        input_size_layout.addWidget(self.input_height)
-        input_size_layout.addWidget(self.auto_checkbox)
-        layout.addRow(self.create_label("Input Size:"), input_size_layout)
-
+        group.content_area.setUpdatesEnabled(False)
+        try:
+            # Overwrite Pose
+            self.overwrite_pose = QCheckBox("Overwrite existing pose data")
+            self.overwrite_pose.setChecked(self.config_data['pose_advanced']['overwrite_pose'])
+            self.overwrite_pose.setToolTip("If unchecked, don't run pose detection again if JSON pose files are found.")
+            rows.append((self.overwrite_pose,))
+
+            # Webcam ID
+            self.webcam_id = QSpinBox()
+            self.webcam_id.setValue(self.config_data['pose_advanced']['webcam_id'])
+            self.webcam_id.setToolTip("Set your webcam ID (0 is default)")
+            rows.append((self.create_label("Webcam ID:"), self.webcam_id))
+
+            # Input Size
+            input_size_layout = QHBoxLayout()
+            self.input_width = QSpinBox()
+            self.input_height = QSpinBox()
+            self.auto_checkbox = QCheckBox("Auto")
+            self.auto_checkbox.setProperty("class", "indented")
+
+            for spinbox in (self.input_width, self.input_height):
+                spinbox.setRange(1, 10000)
+                spinbox.setToolTip("For only webcam, set the input size of the webcam.\n"
+                                    "If 'Auto' is selected, input size will be set to 'auto'. Otherwise, specify the size manually.")
+            current_input_size = self.config_data['pose_advanced']['input_size']
+
+            # 설정된 값이 'auto'라면 체크박스를 선택 상태로 만듦
+            if current_input_size == "auto":
+                self.auto_checkbox.setChecked(True)
+                self.input_width.setEnabled(False)
+                self.input_height.setEnabled(False)
+            else:
+                self.input_width.setValue(current_input_size[0])
+                self.input_height.setValue(current_input_size[1])
+                self.auto_checkbox.setChecked(False)
+
+            input_size_layout.addWidget(QLabel("Width:"))
+            input_size_layout.addWidget(self.input_width)
+            input_size_layout.addWidget(QLabel("Height:"))
+            input_size_layout.addWidget(self.input_height)
+            input_size_layout.addWidget(self.auto_checkbox)
+            rows.append((self.create_label("Input Size:"), input_size_layout))
+
+            # Mode
+            self.mode = QComboBox()
+            self.mode.setModel(self.shared_model(self._POSE_MODES))
+            self.mode.setCurrentText(self.config_data['pose_advanced']['mode'])
+            self.mode.setToolTip("Select the pose estimation mode")
+            rows.append((self.create_label("Mode:"), self.mode))
+
+            # Detection Frequency
+            self.det_frequency = QSlider(Qt.Horizontal)
+            self.det_frequency.setRange(1, 240)
+            self.det_frequency.setValue(self.config_data['pose_advanced']['det_frequency'])
+            self.det_frequency_label = QLabel(f"Detection Frequency: {self.det_frequency.value()}")
+            self.det_frequency.setToolTip("Detect person every N frames (1 = every frame)")
+            rows.append((self.det_frequency_label, self.det_frequency))
+
+            # Keypoints Threshold
+            self.keypoints_threshold = QSlider(Qt.Horizontal)
+            self.keypoints_threshold.setRange(0, 100)
+            self.keypoints_threshold.setValue(int(self.config_data['pose_advanced']['keypoints_threshold'] * 100))
+            self.keypoints_threshold_label = QLabel(f"Keypoints Threshold: {self.keypoints_threshold.value() / 100:.2f}")
+            self.keypoints_threshold.setToolTip("Increase this if only part of a person is on screen to ensure only correctly detected keypoints are used.")
+            rows.append((self.keypoints_threshold_label, self.keypoints_threshold))
+
+            # Show plots and filter for advanced pose settings
+            checkboxes_pose = [("show_plots", "Show Plots"), 
+                            ("filter", "Apply Filter")]
+            for setting, label in checkboxes_pose:
+                checkbox = QCheckBox(label)
+                # 정확한 설정 항목 이름을 사용하여 체크 상태를 결정
+                checkbox.setChecked(self.config_data['pose_advanced'][setting])
+                tip = self._TOOLTIPS.get(setting)
+                if tip:
+                    checkbox.setToolTip(tip)
+                rows.append((checkbox,))
+                setattr(self, f"pose_{setting}", checkbox)  # 변수 이름을 더 명확하게 변경
+
+            # Filter Type
+            self.filter_type = QComboBox()
+            self.filter_type.setModel(self.shared_model(self._FILTER_TYPES))
+            self.filter_type.setCurrentText(self.config_data['pose_advanced']['filter_type'])
+            self.filter_type.setToolTip("Select the type of filter to apply to the pose data")
+            rows.append((self.create_label("Filter Type:"), self.filter_type))
+
+            for row in rows:
+                layout.addRow(*row)
+            group.content_layout.addLayout(layout)
+        finally:
+            group.content_area.setUpdatesEnabled(True)
+
+        # Connect slots only once the initial values are in place
         # "Auto" 체크박스의 상태가 변경될 때 실행되는 함수 연결
         self.auto_checkbox.stateChanged.connect(self.toggle_auto_mode)
-
-
-        # Mode
-        self.mode = QComboBox()
-        self.mode.setStyleSheet(self.combobox_style())
-        self.mode.addItems(["lightweight", "balanced", "performance"])
-        self.mode.setCurrentText(self.config_data['pose_advanced']['mode'])
-        self.mode.setToolTip("Select the pose estimation mode")
-        layout.addRow(self.create_label("Mode:"), self.mode)
-
-        # Detection Frequency
-        self.det_frequency = QSlider(Qt.Horizontal)
-        self.det_frequency.setRange(1, 240)
-        self.det_frequency.setValue(self.config_data['pose_advanced']['det_frequency'])
-        self.det_frequency.setStyleSheet(self.slider_style())
-        self.det_frequency_label = QLabel(f"Detection Frequency: {self.det_frequency.value()}")
-        self.det_frequency_label.setStyleSheet("color: white;")
-        self.det_frequency.valueChanged.connect(self.update_det_frequency_label)
-        self.det_frequency.setToolTip("Detect person every N frames (1 = every frame)")
-        layout.addRow(self.det_frequency_label, self.det_frequency)
-
-        # Keypoints Threshold
-        self.keypoints_threshold = QSlider(Qt.Horizontal)
-        self.keypoints_threshold.setRange(0, 100)
-        self.keypoints_threshold.setValue(int(self.config_data['pose_advanced']['keypoints_threshold'] * 100))
-        self.keypoints_threshold.setStyleSheet(self.slider_style())
-        self.keypoints_threshold_label = QLabel(f"Keypoints Threshold: {self.keypoints_threshold.value() / 100:.2f}")
-        self.keypoints_threshold_label.setStyleSheet("color: white;")
-        self.keypoints_threshold.valueChanged.connect(self.update_keypoints_threshold_label)
-        self.keypoints_threshold.setToolTip("Increase this if only part of a person is on screen to ensure only correctly detected keypoints are used.")
-        layout.addRow(self.keypoints_threshold_label, self.keypoints_threshold)
-
-        # Show plots and filter for advanced pose settings
-        checkboxes_pose = [("show_plots", "Show Plots"), 
-                        ("filter", "Apply Filter")]
-        for setting, label in checkboxes_pose:
-            checkbox = QCheckBox(label)
-            checkbox.setStyleSheet(self.font_adjustment())
-            # 정확한 설정 항목 이름을 사용하여 체크 상태를 결정
-            checkbox.setChecked(self.config_data['pose_advanced'][setting])
-            checkbox.setToolTip(self.tooltips.get(setting, ""))
-            layout.addRow(checkbox)
-            setattr(self, f"pose_{setting}", checkbox)  # 변수 이름을 더 명확하게 변경
-
-        # Filter Type
-        self.filter_type = QComboBox()
-        self.filter_type.setStyleSheet(self.combobox_style())
-        self.filter_type.addItems(["butterworth", "gaussian", "LOESS", "median"])
-        self.filter_type.setCurrentText(self.config_data['pose_advanced']['filter_type'])
-        self.filter_type.setToolTip("Select the type of filter to apply to the pose data")
-        layout.addRow(self.create_label("Filter Type:"), self.filter_type)
-
-        group.content_layout.addLayout(layout)
+        # Slider labels are refreshed at most every 33 ms while a handle is dragged
+        self._det_timer = self.create_label_timer(
+            lambda: self.update_det_frequency_label(self.det_frequency.value()))
+        self.det_frequency.valueChanged.connect(lambda _: self.schedule_label_update(self._det_timer))
+        self._threshold_timer = self.create_label_timer(
+            lambda: self.update_keypoints_threshold_label(self.keypoints_threshold.value()))
+        self.keypoints_threshold.valueChanged.connect(lambda _: self.schedule_label_update(self._threshold_timer))
 
     def setup_advanced_angles_settings(self, group):
         layout = QFormLayout()
         layout.setVerticalSpacing(10)
+        layout.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        rows = []
 
         checkboxes_ang = [("show_plots", "Show Plots"),
                         ("filter", "Apply Filter"),
@@ -364,51 +418,52 @@ class SettingsPanel(QWidget):
                         ("show_angles_on_vid", "Show Angles on Video"),
                         ("flip_left_right", "Flip Left/Right")]
 
-        for setting, label in checkboxes_ang:
-            checkbox = QCheckBox(label)
-            checkbox.setStyleSheet(self.font_adjustment())
-            # 정확한 설정 항목 이름을 사용하여 체크 상태를 결정
-            checkbox.setChecked(self.config_data['compute_angles_advanced'][setting])
-            if setting == "flip_left_right":
-                checkbox.setToolTip("Same angles whether the participant faces left/right. Uncheck for continuous timeseries when participant switches stance.")
-            layout.addRow(checkbox)
-            setattr(self, f"angles_{setting}", checkbox)  # 변수 이름을 더 명확하게 변경
-
-        self.filter_type_ang = QComboBox()
-        self.filter_type_ang.setStyleSheet(self.combobox_style())
-        self.filter_type_ang.addItems(["butterworth", "gaussian", "LOESS", "median"])
-        self.filter_type_ang.setCurrentText(self.config_data['compute_angles_advanced']['filter_type'])
-        self.filter_type_ang.setToolTip("Select the type of filter to apply to the angle data")
-        layout.addRow(self.create_label("Filter Type:"), self.filter_type_ang)
-
-        group.content_layout.addLayout(layout)
-
-
-    def font_adjustment(self):
-        return """
-            font-size: 14px;
-            color: white;
-            font-weight: bold;
-        """
+        group.content_area.setUpdatesEnabled(False)
+        try:
+            for setting, label in checkboxes_ang:
+                checkbox = QCheckBox(label)
+                # 정확한 설정 항목 이름을 사용하여 체크 상태를 결정
+                checkbox.setChecked(self.config_data['compute_angles_advanced'][setting])
+                tip = self._TOOLTIPS.get(setting)
+                if tip:
+                    checkbox.setToolTip(tip)
+                rows.append((checkbox,))
+                setattr(self, f"angles_{setting}", checkbox)  # 변수 이름을 더 명확하게 변경
+
+            self.filter_type_ang = QComboBox()
+            self.filter_type_ang.setModel(self.shared_model(self._FILTER_TYPES))
+            self.filter_type_ang.setCurrentText(self.config_data['compute_angles_advanced']['filter_type'])
+            self.filter_type_ang.setToolTip("Select the type of filter to apply to the angle data")
+            rows.append((self.create_label("Filter Type:"), self.filter_type_ang))
+
+            for row in rows:
+                layout.addRow(*row)
+            group.content_layout.addLayout(layout)
+        finally:
+            group.content_area.setUpdatesEnabled(True)
+
+
+    @classmethod
+    def shared_model(cls, items):
+        # One read-only model per choice list, shared by every combo box that offers it
+        model = cls._shared_models.get(items)
+        if model is None:
+            model = cls._shared_models[items] = QStringListModel(list(items))
+        return model
+
+    def create_label_timer(self, slot):
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(33)
+        timer.timeout.connect(slot)
+        return timer
 
-    def slider_style(self):
-        return """
-            QSlider::groove:horizontal {
-                border: 1px solid #999999;
-                height: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #B1B1B1, stop:1 #c4c4c4);
-                margin: 2px 0;
-            }
+    @staticmethod
+    def schedule_label_update(timer):
+        # Don't restart a pending timer, otherwise a continuous drag would postpone the update until release
+        if not timer.isActive():
+            timer.start()
 
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #4d4d4d, stop:1 #333333); 
-                border: 1px solid #333333; 
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 3px;
-            }
-            """
-    
     def update_det_frequency_label(self, value):
         self.det_frequency_label.setText(f"Detection Frequency: {value}")
 
@@ -427,136 +482,88 @@ class SettingsPanel(QWidget):
             self.input_height.setEnabled(True)
 
     def set_styles(self):
-        # 툴팁 스타일과 폰트 스타일을 함께 설정
-        app = QApplication.instance()
-        app.setStyleSheet("""
-            QToolTip {
-                color: white;
-                background-color: #2C3E50;
-                border: 1px solid #34495E;
-                padding: 5px;
-            }
+        # Every widget style of the panel lives in this one sheet so Qt parses it once;
+        # tooltips are styled by the main window's application-wide theme sheet
+        self.setStyleSheet("""
             QWidget {
                 font-weight: bold;
             }
-        """)
-
-    def listwidget_style(self):
-        return """
-            QListWidget {
-                background-color: #2C3E50;
-                color: white;
-                border: 1px solid #34495E;
-                border-radius: 3px;
-            }
-            QListWidget::item:selected {
-                background-color: #3498DB;
+            QLabel, QCheckBox, QSlider {
+                background-color: transparent;
+                padding: 5px;
             }
-        """
-
-    def create_styled_button(self, text, color, callback):
-        btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
+            QLabel, QCheckBox {
                 color: white;
-                border: none;
-                padding: 10px;
-                font-size: 16px;
+                font-size: 14px;
                 font-weight: bold;
-                border-radius: 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.lighten_color(color)};
-            }}
-        """)
-        btn.clicked.connect(callback)
-        return btn
-
-    @staticmethod
-    def lighten_color(color):
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        factor = 1.2
-        r, g, b = [min(int(x * factor), 255) for x in (r, g, b)]
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    @staticmethod
-    def darken_color(color):
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        factor = 0.8
-        r, g, b = [max(int(x * factor), 0) for x in (r, g, b)]
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def create_label(self, text):
-        label = QLabel(text)
-        label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-        """)
-        return label
-
-    def spinbox_style(self):
-        return """
-            QSpinBox, QDoubleSpinBox {
+            }
+            QCheckBox[class="indented"] {
+                padding-left: 20px;
+            }
+            QLineEdit, QSpinBox, QDoubleSpinBox {
                 background-color: #2C3E50;
                 color: white;
                 border: 1px solid #34495E;
                 padding: 5px;
                 border-radius: 3px;
             }
-            QSpinBox::up-button, QDoubleSpinBox::up-button, 
+            QSpinBox::up-button, QDoubleSpinBox::up-button,
             QSpinBox::down-button, QDoubleSpinBox::down-button {
                 width: 20px;
             }
-        """
-
-    def lineedit_style(self):
-        return """
-            QLineEdit {
+            QListWidget {
                 background-color: #2C3E50;
                 color: white;
                 border: 1px solid #34495E;
-                padding: 5px;
                 border-radius: 3px;
             }
-        """
-
-    def checkbox_style(self):
-        return """
-            QCheckBox {
-                color: white;
-                font-size: 16px;
+            QListWidget::item:selected {
+                background-color: #3498DB;
+            }
+            QComboBox {
+                background-color: #34495E;
+                color: #ECF0F1;
+                border: 1px solid #2980B9;
+                border-radius: 5px;
+                padding: 5px;
             }
-            QCheckBox::indicator {
+            QComboBox::drop-down {
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
                 width: 20px;
-                height: 20px;
+                border-left-width: 1px;
+                border-left-color: #2980B9;
+                border-left-style: solid;
+                border-top-right-radius: 5px;
+                border-bottom-right-radius: 5px;
+            }
+            QComboBox::down-arrow {
+                image: url(path_to_down_arrow_icon.png);
+            }
+            QSlider::groove:horizontal {
+                border: 1px solid #999999;
+                height: 8px;
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #B1B1B1, stop:1 #c4c4c4);
+                margin: 2px 0;
+            }
+            QSlider::handle:horizontal {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #4d4d4d, stop:1 #333333);
+                border: 1px solid #333333;
+                width: 18px;
+                margin: -2px 0;
+                border-radius: 3px;
             }
-        """
-
-
-    def combobox_style(self):
-        return """
-        QComboBox {
-            background-color: #34495E;
-            color: #ECF0F1;
-            border: 1px solid #2980B9;
-            border-radius: 5px;
-            padding: 5px;
-        }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left-width: 1px;
-            border-left-color: #2980B9;
-            border-left-style: solid;
-            border-top-right-radius: 5px;
-            border-bottom-right-radius: 5px;
-        }
-        QComboBox::down-arrow {
-            image: url(path_to_down_arrow_icon.png);
-        }
-        """
+        """)
+
+    def create_styled_button(self, text, action, callback):
+        # Colors come from the QPushButton[action=...] rules of the theme sheet
+        btn = QPushButton(text)
+        btn.setProperty("action", action)
+        btn.clicked.connect(callback)
+        return btn
+
+    def create_label(self, text):
+        return QLabel(text)
 
     def apply_settings(self):
         # Basic Settings
@@ -568,11 +575,13 @@ class SettingsPanel(QWidget):
         ]
         self.config_data['pose']['time_range'] = time_range if any(time_range) else []
 
+        jl, names = self.joint_angles_list, self._joint_names
         self.config_data['compute_angles']['joint_angles'] = [
-            item.text() for item in self.joint_angles_list.selectedItems()
+            names[i] for i in range(jl.count()) if jl.item(i).isSelected()
         ]
+        sl, names = self.segment_angles_list, self._segment_names
         self.config_data['compute_angles']['segment_angles'] = [
-            item.text() for item in self.segment_angles_list.selectedItems()
+            names[i] for i in range(sl.count()) if sl.item(i).isSelected()
         ]
 
         # Advanced Pose Settings
@@ -607,22 +616,32 @@ class SettingsPanel(QWidget):
             for setting_name, spin_box in settings.items():
                 self.config_data['compute_angles_advanced'][filter_name][setting_name] = spin_box.value()
 
-        # Save updated config to file
+        # Save updated config to file. It is written next to the config under a per-process name
+        # and swapped in, so a crash never leaves a truncated file and concurrent saves don't collide
+        tmp_path = f"{self.config_path}.{os.getpid()}.tmp"
         try:
-            with open(self.config_path, 'w') as f:
+            with open(tmp_path, 'w', encoding='utf-8', newline='\n', buffering=65536) as f:
                 toml.dump(self.config_data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
             QMessageBox.information(self, "Settings", "Configuration updated successfully!")
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             QMessageBox.warning(self, "Error", f"Failed to save configuration: {str(e)}")
 
     def go_back(self):
         self.main_window.show_main_panel()
 
-
 class InstallationPanel(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self.process = None
+        self.pending_commands = []
         self.setup_ui()
 
     def setup_ui(self):
@@ -630,23 +649,14 @@ class InstallationPanel(QWidget):
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
-        install_btn = self.create_styled_button("Install Sports2D", "#2ECC71", self.install_package)
-        remove_btn = self.create_styled_button("Remove Sports2D", "#E74C3C", self.remove_package)
-        
-        layout.addWidget(install_btn)
-        layout.addWidget(remove_btn)
+        self.install_btn = self.create_styled_button("Install Sports2D", "install", self.install_package)
+        self.remove_btn = self.create_styled_button("Remove Sports2D", "remove", self.remove_package)
+
+        layout.addWidget(self.install_btn)
+        layout.addWidget(self.remove_btn)
 
         self.gpu_checkbox = QCheckBox("Faster inference with GPU")
-        self.gpu_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: white;
-                font-size: 16px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-            }
-        """)
+        self.gpu_checkbox.setObjectName("gpuCheckbox")
         layout.addWidget(self.gpu_checkbox)
 
         note_message = QLabel(
@@ -655,132 +665,388 @@ class InstallationPanel(QWidget):
             "Be aware that GPU support takes an additional 6 GB on disk."
         )
         note_message.setWordWrap(True)
-        note_message.setStyleSheet("color: #CCCCCC; font-size: 14px; margin-top: 10px;")
+        note_message.setObjectName("noteMessage")
         layout.addWidget(note_message)
 
-        back_button = self.create_styled_button("Back", "#34495E", self.main_window.show_main_panel)
+        # Busy indicator and pip output, only shown while commands are running or after they ran
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(2000)
+        self.log_view.hide()
+        layout.addWidget(self.log_view)
+
+        back_button = self.create_styled_button("Back", "back", self.main_window.show_main_panel)
         back_button.setFixedSize(100, 40)
         layout.addWidget(back_button, alignment=Qt.AlignRight | Qt.AlignBottom)
 
-    def create_styled_button(self, text, color, callback):
+    def create_styled_button(self, text, action, callback):
+        # Colors come from the QPushButton[action=...] rules of the theme sheet
         btn = QPushButton(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 10px;
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.lighten_color(color)};
-            }}
-        """)
+        btn.setProperty("action", action)
         btn.clicked.connect(callback)
         return btn
 
-    @staticmethod
-    def lighten_color(color):
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        return f"#{min(int(r*1.2), 255):02x}{min(int(g*1.2), 255):02x}{min(int(b*1.2), 255):02x}"
-
     def install_package(self):
-        try:
-            subprocess.run(["pip", "install", "git+https://github.com/hunminkim98/Sports2D.git"], check=True)
-            if self.gpu_checkbox.isChecked():
-                subprocess.run(["pip3", "install", "torch", "torchvision", "torchaudio", "--index-url", "https://download.pytorch.org/whl/cu124"], check=True)
-                subprocess.run(["pip", "install", "onnxruntime-gpu"], check=True)
-            QMessageBox.information(self, "Success", "Sports2D package installed successfully.")
-        except subprocess.CalledProcessError:
-            QMessageBox.warning(self, "Error", "Failed to install Sports2D package.")
+        # `python -m pip` targets the interpreter running the GUI, whichever pip/pip3 is on PATH
+        packages = ["git+https://github.com/hunminkim98/Sports2D.git"]
+        if self.gpu_checkbox.isChecked():
+            packages.append("onnxruntime-gpu")
+        commands = [[sys.executable, "-m", "pip", "install", *packages]]
+        if self.gpu_checkbox.isChecked():
+            # Kept as a separate call: as an extra index, PyPI's newer CPU-only torch would win the resolve
+            commands.append([sys.executable, "-m", "pip", "install", "torch", "torchvision", "torchaudio",
+                             "--index-url", "https://download.pytorch.org/whl/cu124"])
+        self.run_commands(commands, "Sports2D package installed successfully.", "Failed to install Sports2D package.")
 
     def remove_package(self):
-        try:
-            subprocess.run(["pip", "uninstall", "Sports2D", "-y"], check=True)
-            if self.gpu_checkbox.isChecked():
-                subprocess.run(["pip", "uninstall", "torch", "torchvision", "torchaudio", "onnxruntime-gpu", "-y"], check=True)
-            QMessageBox.information(self, "Success", "Sports2D package removed successfully.")
-        except subprocess.CalledProcessError:
-            QMessageBox.warning(self, "Error", "Failed to remove Sports2D package.")
+        packages = ["Sports2D"]
+        if self.gpu_checkbox.isChecked():
+            packages += ["torch", "torchvision", "torchaudio", "onnxruntime-gpu"]
+        self.run_commands([[sys.executable, "-m", "pip", "uninstall", "-y", *packages]],
+                          "Sports2D package removed successfully.", "Failed to remove Sports2D package.")
+
+    def run_commands(self, commands, success_message, error_message):
+        # pip runs in a QProcess so the event loop keeps running; commands are chained from `finished`
+        if self.process is not None:
+            QMessageBox.information(self, "Busy", "Another pip command is still running.")
+            return
+        self.pending_commands = list(commands)
+        self.success_message = success_message
+        self.error_message = error_message
+        self.log_view.clear()
+        self.log_view.show()
+        self.set_busy(True)
+        self.run_next_command()
+
+    def set_busy(self, busy):
+        for widget in (self.install_btn, self.remove_btn, self.gpu_checkbox):
+            widget.setEnabled(not busy)
+        self.progress_bar.setVisible(busy)
+
+    def run_next_command(self):
+        if not self.pending_commands:
+            self.process = None
+            self.set_busy(False)
+            QMessageBox.information(self, "Success", self.success_message)
+            return
+        program, *args = self.pending_commands.pop(0)
+        self.append_log(f"$ {' '.join([program, *args])}\n")
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.on_command_output)
+        self.process.finished.connect(self.on_command_finished)
+        self.process.errorOccurred.connect(self.on_command_error)
+        self.process.start(program, args)
+
+    def on_command_output(self):
+        self.append_log(self.process.readAllStandardOutput().data().decode(errors='replace'))
+
+    def append_log(self, text):
+        # Insert at the end without adding line breaks, pip output arrives in arbitrary chunks
+        self.log_view.moveCursor(QTextCursor.End)
+        self.log_view.insertPlainText(text)
+        self.log_view.ensureCursorVisible()
+
+    def on_command_finished(self, exit_code, exit_status):
+        self.process.deleteLater()
+        if exit_status != QProcess.NormalExit or exit_code != 0:
+            self.abort_commands()
+            return
+        self.run_next_command()
+
+    def on_command_error(self, error):
+        # `finished` is never emitted when the program cannot be started
+        if error == QProcess.FailedToStart:
+            self.process.deleteLater()
+            self.abort_commands()
+
+    def stop_commands(self):
+        # Kill pip without reporting it as a failed command, e.g. when the window closes
+        if self.process is None:
+            return
+        self.process.blockSignals(True)
+        self.process.kill()
+        self.process.waitForFinished()
+        self.process = None
+        self.pending_commands = []
+
+    def abort_commands(self):
+        self.process = None
+        self.pending_commands = []
+        self.set_busy(False)
+        QMessageBox.warning(self, "Error", self.error_message)
+
+# Seconds a downloaded demo GIF is used as-is before it is revalidated with the server
+GIF_CACHE_MAX_AGE = 24 * 60 * 60
+
+class RoundedFrame(QFrame):
+    # Paints its rounded background directly instead of through a border-radius style sheet rule
+    def __init__(self, parent=None, color="#34495e", radius=20):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.radius = radius
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.color)
+        painter.drawRoundedRect(self.rect(), self.radius, self.radius)
 
 class MainPanel(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        # Room for the scaled GIF frames (in KB) on top of Qt's default 10 MB pixmap cache
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20480))
+        self.gif_movie = None
+        self.gif_reply = None
+        self.last_gif_size = QSize()
+        # Rescale the GIF at most once per frame while the window is being resized
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(16)
+        self.resize_timer.timeout.connect(self.scale_gif)
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.setup_ui()
 
     def setup_ui(self):
-        self.background_frame = QFrame(self)
-        self.background_frame.setObjectName("backgroundFrame")
-        self.background_frame.setStyleSheet("""
-            #backgroundFrame {
-                background-color: #34495e;
-                border-radius: 20px;
-            }
-        """)
-        self.main_layout.addWidget(self.background_frame)
-
-        self.content_layout = QVBoxLayout(self.background_frame)
-        self.content_layout.setSpacing(20)
-
-        self.info_label = QLabel("Compute 2D joint and segment angles of your athletes or patients from real-time video streams or video files!")
-        self.info_label.setWordWrap(True)
-        self.info_label.setAlignment(Qt.AlignCenter)
-        self.info_label.setStyleSheet("""
-            color: white;
-            font-weight: bold;
-            font-size: 16px;
-            padding: 20px;
-            border-radius: 20px;
-        """)
-        self.content_layout.addWidget(self.info_label)
+        # Build the panel with a single layout/paint pass
+        self.setUpdatesEnabled(False)
+        try:
+            self.background_frame = RoundedFrame(self)
+            self.main_layout.addWidget(self.background_frame)
 
-        self.gif_label = QLabel()
-        self.gif_label.setAlignment(Qt.AlignCenter)
-        self.gif_label.setStyleSheet("""
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(self.gif_label)
+            self.content_layout = QVBoxLayout(self.background_frame)
+            self.content_layout.setSpacing(20)
+
+            self.info_label = QLabel("Compute 2D joint and segment angles of your athletes or patients from real-time video streams or video files!")
+            self.info_label.setWordWrap(True)
+            self.info_label.setAlignment(Qt.AlignCenter)
+            self.info_label.setObjectName("infoLabel")
+            self.content_layout.addWidget(self.info_label)
 
-        self.content_layout.addStretch(1)
+            # Placeholder shown until the GIF is loaded from the cache or the network
+            self.gif_label = QLabel("Loading demo...")
+            self.gif_label.setAlignment(Qt.AlignCenter)
+            self.gif_label.setObjectName("gifLabel")
+            self.content_layout.addWidget(self.gif_label)
 
-        # Download and set up the GIF
-        self.setup_gif()
+            self.content_layout.addStretch(1)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Download and set up the GIF once the window has had its first paint
+        QTimer.singleShot(0, self.setup_gif)
 
     def setup_gif(self):
         gif_url = "https://github.com/davidpagnon/Sports2D/blob/main/Content/demo_gif.gif?raw=true"
-        temp_dir = tempfile.gettempdir()
-        temp_gif_path = os.path.join(temp_dir, "sports2d_demo.gif")
-
-        # Download the GIF
-        urlretrieve(gif_url, temp_gif_path)
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        if not cache_dir:
+            # No per-user cache directory: download into memory rather than under a guessable
+            # name in the shared temp directory, where another local user could plant the file
+            reply = self.main_window.network_manager.get(QNetworkRequest(QUrl(gif_url)))
+            self.gif_reply = reply
+            reply.finished.connect(lambda: self.on_gif_fetched(reply))
+            return
+        # Name the cached file after the URL so every run and every running instance shares it
+        gif_name = f"sports2d_{hashlib.md5(gif_url.encode()).hexdigest()}.gif"
+        self.gif_path = os.path.join(cache_dir, gif_name)
+        self.gif_meta_path = self.gif_path + ".json"
+
+        # A GIF validated less than a day ago is used without touching the network
+        cached = os.path.exists(self.gif_path) and os.path.getsize(self.gif_path) > 0
+        if cached and time.time() - os.path.getmtime(self.gif_path) < GIF_CACHE_MAX_AGE:
+            self.start_gif()
+            return
+
+        # Otherwise revalidate it with a conditional GET: a 304 reply costs no transfer
+        request = QNetworkRequest(QUrl(gif_url))
+        if cached:
+            try:
+                with open(self.gif_meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("etag"):
+                request.setRawHeader(b"If-None-Match", meta["etag"].encode())
+            if meta.get("last_modified"):
+                request.setRawHeader(b"If-Modified-Since", meta["last_modified"].encode())
+
+        # Download asynchronously so the window paints while the GIF is in flight.
+        # Chunks are streamed to a per-process file and renamed at the end, so concurrent
+        # launches never read a partial file and the GIF is never held whole in memory.
+        self.gif_tmp_path = f"{self.gif_path}.{os.getpid()}.tmp"
+        try:
+            # The cache directory may not exist yet, e.g. on the first run
+            os.makedirs(cache_dir, exist_ok=True)
+            self.gif_tmp_file = open(self.gif_tmp_path, 'wb', buffering=1 << 20)
+        except OSError as e:
+            print(f"Error: could not write the demo GIF to the cache: {e}")
+            self.fall_back_to_cached_gif(cached)
+            return
+        self.gif_write_failed = False
+        reply = self.main_window.network_manager.get(request)
+        self.gif_reply = reply
+        reply.readyRead.connect(lambda: self.on_gif_chunk(reply))
+        reply.finished.connect(lambda: self.on_gif_downloaded(reply, cached))
+
+    def on_gif_chunk(self, reply):
+        try:
+            self.gif_tmp_file.write(reply.readAll().data())
+        except OSError as e:
+            # E.g. a full disk: stop the transfer, `finished` then discards the temp file
+            print(f"Error: could not write the demo GIF to the cache: {e}")
+            self.gif_write_failed = True
+            reply.abort()
+
+    def discard_gif_tmp(self):
+        # close() still releases the file when flushing the buffered tail fails
+        for cleanup in (self.gif_tmp_file.close, lambda: os.remove(self.gif_tmp_path)):
+            try:
+                cleanup()
+            except OSError:
+                pass
+
+    def fall_back_to_cached_gif(self, cached):
+        if cached:
+            self.start_gif()
+        else:
+            self.gif_label.clear()
+
+    def abort_gif_download(self):
+        # Aborting emits `finished` right away, which discards the partial download
+        if self.gif_reply is not None:
+            self.gif_reply.abort()
+
+    def on_gif_downloaded(self, reply, cached):
+        reply.deleteLater()
+        self.gif_reply = None
+        if reply.error() == QNetworkReply.OperationCanceledError and not self.gif_write_failed:
+            # Aborted because the window is closing; the reply has nothing left to read
+            self.discard_gif_tmp()
+            return
+        if not self.gif_write_failed:
+            try:
+                if reply.error() == QNetworkReply.NoError:
+                    self.gif_tmp_file.write(reply.readAll().data())
+                self.gif_tmp_file.close()
+            except OSError as e:
+                print(f"Error: could not write the demo GIF to the cache: {e}")
+                self.gif_write_failed = True
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if self.gif_write_failed or reply.error() != QNetworkReply.NoError or status != 200:
+            self.discard_gif_tmp()
+            if status == 304:
+                # Still current: restart the freshness window
+                try:
+                    os.utime(self.gif_path)
+                except OSError as e:
+                    print(f"Warning: could not refresh the cached demo GIF: {e}")
+            elif reply.error() not in (QNetworkReply.NoError, QNetworkReply.OperationCanceledError):
+                # A cancel here came from on_gif_chunk, which already reported the write error
+                print(f"Error: failed to download the demo GIF: {reply.errorString()}")
+            self.fall_back_to_cached_gif(cached)
+            return
 
-        # Set up the QMovie with the downloaded GIF
-        self.gif_movie = QMovie(temp_gif_path)
+        try:
+            os.replace(self.gif_tmp_path, self.gif_path)
+        except OSError as e:
+            print(f"Error: could not update the cached demo GIF: {e}")
+            self.discard_gif_tmp()
+            self.fall_back_to_cached_gif(cached)
+            return
+        # rawHeaderPairs keeps the same signature across PySide6 releases, unlike rawHeader()
+        headers = {bytes(name).lower(): bytes(value).decode() for name, value in reply.rawHeaderPairs()}
+        meta = {"etag": headers.get(b"etag", ""), "last_modified": headers.get(b"last-modified", "")}
+        try:
+            with open(self.gif_meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"Warning: could not write GIF cache metadata: {e}")
+        self.start_gif()
+
+    def on_gif_fetched(self, reply):
+        reply.deleteLater()
+        self.gif_reply = None
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            return
+        if reply.error() != QNetworkReply.NoError:
+            print(f"Error: failed to download the demo GIF: {reply.errorString()}")
+            self.gif_label.clear()
+            return
+        self.start_gif(reply.readAll().data())
+
+    def start_gif(self, gif_data=None):
+        # Read the cached GIF once and let QMovie decode it from memory, so the movie never
+        # keeps the cache file open while another instance revalidates and replaces it
+        if gif_data is None:
+            try:
+                with open(self.gif_path, 'rb') as f:
+                    gif_data = f.read()
+            except OSError as e:
+                print(f"Error: failed to read the demo GIF: {e}")
+                self.gif_label.clear()
+                return
+        # QMovie reads from the buffer lazily, so it is kept alive as an attribute
+        self.gif_buffer = QBuffer(self)
+        self.gif_buffer.setData(QByteArray(gif_data))
+        self.gif_buffer.open(QBuffer.ReadOnly)
+        self.gif_movie = QMovie(self.gif_buffer, b"gif")
+        # Decode every frame once; loops and rescales then reuse the cached frames
+        self.gif_movie.setCacheMode(QMovie.CacheAll)
         self.gif_label.setMovie(self.gif_movie)
+        self.last_gif_size = QSize()
+        self.scale_gif()
         self.gif_movie.start()
 
-    def resizeEvent(self, event):
+    def scale_gif(self):
+        if self.gif_movie is None:
+            return
         new_size = self.size()
-        
+
         gif_width = int(new_size.width() * 0.95)
         gif_height = int(new_size.height() * 0.95)
-        self.gif_movie.setScaledSize(QSize(gif_width, gif_height))
+        gif_size = QSize(gif_width, gif_height)
+        # setScaledSize drops QMovie's scaled frame even when the size is unchanged
+        if gif_size == self.last_gif_size:
+            return
+        self.last_gif_size = gif_size
+        self.gif_movie.setScaledSize(gif_size)
+        # Half frame rate when the GIF is too small for the motion to be worth decoding at full speed
+        self.gif_movie.setSpeed(50 if gif_width * gif_height < 200 * 200 else 100)
+
+    def resizeEvent(self, event):
+        if not self.resize_timer.isActive():
+            self.resize_timer.start()
 
         super().resizeEvent(event)
 
+# One application-wide sheet per theme, shipped as themes/<name>.qss next to this script;
+# widgets are matched by object name or property
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'themes')
+
+@functools.cache
+def load_theme_qss(name):
+    with open(os.path.join(THEMES_DIR, f"{name}.qss"), encoding='utf-8') as f:
+        return f.read()
+
 class CustomStyleWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Sports2D")
         self.resize(1024, 600)
         self.setMinimumSize(600, 400)
-        self.current_theme = "Dark"
+        self._is_dark = True
+        self._last_applied_theme = None  # None until a sheet is installed, then the last _is_dark
+        # One manager for the whole app so every request shares its connection pool and TLS sessions
+        self.network_manager = QNetworkAccessManager(self)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -789,11 +1055,11 @@ class CustomStyleWindow(QMainWindow):
         left_widget = self.create_left_panel()
         main_layout.addWidget(left_widget)
 
-        self.right_stack = QStackedWidget()
-        main_layout.addWidget(self.right_stack)
-
+        # Panels sit directly in the main layout and are switched by hiding/showing them
+        self.main_layout = main_layout
         self.main_panel = MainPanel(self)
-        self.right_stack.addWidget(self.main_panel)
+        self.main_layout.addWidget(self.main_panel)
+        self.current_panel = self.main_panel
 
         self.settings_panel = None
         self.installation_panel = None
@@ -802,275 +1068,109 @@ class CustomStyleWindow(QMainWindow):
 
     def create_left_panel(self):
         left_widget = QWidget()
-        left_widget.setFixedWidth(200)
-        left_layout = QVBoxLayout(left_widget)
-        left_layout.setSpacing(10)
-        left_layout.setContentsMargins(10, 10, 10, 10)
-
-        title_label = QLabel("Sports2D")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #3498db;")
-        title_label.setContentsMargins(40, 0, 0, 10)
-        left_layout.addWidget(title_label)
-
-        btn_texts = ["Installation", "Real-time Analysis", "Video Analysis", "Settings"]
-        for text in btn_texts:
-            btn = QPushButton(text)
-            btn.setFixedHeight(40)
-            btn.setStyleSheet(self.button_style())
-            left_layout.addWidget(btn)
-            if text == "Installation":
-                btn.clicked.connect(self.show_installation_panel)
-            elif text == "Settings":
-                btn.clicked.connect(self.show_settings_panel)
-
-        left_layout.addStretch(1)
-
-        appearance_label = QLabel("Appearance Mode")
-        appearance_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-        appearance_label.setContentsMargins(22, 0, 0, 0)
-        left_layout.addWidget(appearance_label)
-        
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Dark", "Light"])
-        self.theme_combo.currentTextChanged.connect(self.change_theme)
-        self.theme_combo.setStyleSheet(self.combobox_style())
-        left_layout.addWidget(self.theme_combo)
+        # Build the sidebar with a single layout/paint pass
+        left_widget.setUpdatesEnabled(False)
+        try:
+            left_widget.setFixedWidth(200)
+            left_layout = QVBoxLayout(left_widget)
+            left_layout.setSpacing(10)
+            left_layout.setContentsMargins(10, 10, 10, 10)
+
+            title_label = QLabel("Sports2D")
+            title_label.setObjectName("titleLabel")
+            title_label.setContentsMargins(40, 0, 0, 10)
+            left_layout.addWidget(title_label)
+
+            btn_texts = ["Installation", "Real-time Analysis", "Video Analysis", "Settings"]
+            for text in btn_texts:
+                btn = QPushButton(text)
+                btn.setFixedHeight(40)
+                btn.setProperty("navButton", True)
+                left_layout.addWidget(btn)
+                if text == "Installation":
+                    btn.clicked.connect(self.show_installation_panel)
+                elif text == "Settings":
+                    btn.clicked.connect(self.show_settings_panel)
+
+            left_layout.addStretch(1)
+
+            appearance_label = QLabel("Appearance Mode")
+            appearance_label.setObjectName("appearanceLabel")
+            appearance_label.setContentsMargins(22, 0, 0, 0)
+            left_layout.addWidget(appearance_label)
+
+            self.theme_combo = QComboBox()
+            self.theme_combo.addItems(["Dark", "Light"])
+            self.theme_combo.textActivated.connect(self.change_theme)
+            self.theme_combo.setObjectName("themeCombo")
+            left_layout.addWidget(self.theme_combo)
+        finally:
+            left_widget.setUpdatesEnabled(True)
 
         return left_widget
 
+    def add_panel(self, panel):
+        # Hide explicitly so the layout doesn't show the new panel on its own
+        panel.hide()
+        self.main_layout.addWidget(panel)
+        return panel
+
+    def show_panel(self, panel):
+        if panel is self.current_panel:
+            return
+        self.current_panel.hide()
+        panel.show()
+        self.current_panel = panel
+
     def show_installation_panel(self):
         if not self.installation_panel:
-            self.installation_panel = InstallationPanel(self)
-            self.right_stack.addWidget(self.installation_panel)
-        self.right_stack.setCurrentWidget(self.installation_panel)
+            self.installation_panel = self.add_panel(InstallationPanel(self))
+        self.show_panel(self.installation_panel)
 
     def show_settings_panel(self):
         if not self.settings_panel:
-            self.settings_panel = SettingsPanel(self)  # self를 전달하여 main_window 참조 제공
-            self.right_stack.addWidget(self.settings_panel)
-        self.right_stack.setCurrentWidget(self.settings_panel)
+            self.settings_panel = self.add_panel(SettingsPanel(self))  # self를 전달하여 main_window 참조 제공
+        self.show_panel(self.settings_panel)
+
+    def closeEvent(self, event):
+        # Killing pip halfway can leave a half-installed environment, so ask before closing
+        panel = self.installation_panel
+        if panel is not None and panel.process is not None:
+            answer = QMessageBox.question(
+                self, "pip is still running",
+                "Closing now stops pip halfway and may leave packages partially installed or removed.\n"
+                "Close anyway?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if answer != QMessageBox.Yes:
+                event.ignore()
+                return
+            panel.stop_commands()
+        # Don't leave a partial GIF download behind in the cache directory
+        self.main_panel.abort_gif_download()
+        super().closeEvent(event)
 
     def show_main_panel(self):
-        self.right_stack.setCurrentWidget(self.main_panel)
+        self.show_panel(self.main_panel)
 
     def change_theme(self, theme):
-        self.current_theme = theme
+        self._is_dark = theme == "Dark"
         self.apply_theme()
 
     def apply_theme(self):
-        if self.current_theme == "Dark":
-            self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2C3E50;
-                color: #ECF0F1;
-            }
-            QGroupBox {
-                border: 1px solid #34495E;
-                margin-top: 0.5em;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px 0 3px;
-            }
-            """)
-        else:  # Light theme
-            self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #ECF0F1;
-                color: #2C3E50;
-            }
-            QGroupBox {
-                border: 1px solid #BDC3C7;
-                margin-top: 0.5em;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px 0 3px;
-            }
-            """)
-
-        self.main_panel.setStyleSheet(self.main_panel.styleSheet())
-        if self.installation_panel:
-            self.installation_panel.setStyleSheet(self.installation_panel.styleSheet())
-        if self.settings_panel:
-            self.settings_panel.setStyleSheet(self.settings_panel.styleSheet())
-
-    def button_style(self):
-        if self.current_theme == "Dark":
-            return """
-            QPushButton {
-                background-color: #34495E;
-                color: #ECF0F1;
-                border-radius: 20px;
-                border: none;
-                padding: 5px;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #2980B9;
-            }
-            QPushButton:pressed {
-                background-color: #2C3E50;
-            }
-            QPushButton:disabled {
-                background-color: #7F8C8D;
-                color: #BDC3C7;
-            }
-            """
-        else:
-            return """
-            QPushButton {
-                background-color: #3498DB;
-                color: #FFFFFF;
-                border-radius: 20px;
-                border: none;
-                padding: 5px;
-                font-size: 15px;
-            }
-            QPushButton:hover {
-                background-color: #2980B9;
-            }
-            QPushButton:pressed {
-                background-color: #21618C;
-            }
-            QPushButton:disabled {
-                background-color: #BDC3C7;
-                color: #7F8C8D;
-            }
-            """
-
-    def label_style(self):
-        if self.current_theme == "Dark":
-            return """
-            QLabel {
-                color: #ECF0F1;
-                background-color: #34495E;
-                padding: 10px;
-                border-radius: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            """
-        else:
-            return """
-            QLabel {
-                color: #2C3E50;
-                background-color: #BDC3C7;
-                padding: 10px;
-                border-radius: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            """
-
-
-    def checkbox_style(self):
-        if self.current_theme == "Dark":
-            return """
-            QCheckBox {
-                color: #ECF0F1;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3498DB;
-                border: 1px solid #2980B9;
-                border-radius: 5px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #34495E;
-                border: 1px solid #2980B9;
-                border-radius: 5px;
-            }
-            QCheckBox::indicator:disabled {
-                background-color: #7F8C8D;
-                border: 1px solid #BDC3C7;
-                border-radius: 5px;
-            }
-            """
-        else:
-            return """
-            QCheckBox {
-                color: #2C3E50;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3498DB;
-                border: 1px solid #2980B9;
-                border-radius: 5px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #ECF0F1;
-                border: 1px solid #2980B9;
-                border-radius: 5px;
-            }
-            QCheckBox::indicator:disabled {
-                background-color: #BDC3C7;
-                border: 1px solid #7F8C8D;
-                border-radius: 5px;
-            }
-            """
-
-    
-    def combobox_style(self):
-        if self.current_theme == "Dark":
-            return """
-            QComboBox {
-                background-color: #34495E;
-                color: #ECF0F1;
-                border: 1px solid #2980B9;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #2980B9;
-                border-left-style: solid;
-                border-top-right-radius: 5px;
-                border-bottom-right-radius: 5px;
-            }
-            QComboBox::down-arrow {
-                image: url(path_to_down_arrow_icon.png);
-            }
-            """
-        else:
-            return """
-            QComboBox {
-                background-color: #ECF0F1;
-                color: #2C3E50;
-                border: 1px solid #3498DB;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #3498DB;
-                border-left-style: solid;
-                border-top-right-radius: 5px;
-                border-bottom-right-radius: 5px;
-            }
-            QComboBox::down-arrow {
-                image: url(path_to_down_arrow_icon.png);
-            }
-            """
+        # Installing a sheet re-polishes every widget, so skip it when the theme did not change
+        if self._last_applied_theme == self._is_dark:
+            return
+        app = QApplication.instance()
+        # setStyleSheet replaces the sheet rather than merging it; going through an empty sheet is
+        # only for speed, as OBS Studio measured it faster than swapping two large sheets directly
+        if self._last_applied_theme is not None:
+            app.setStyleSheet("")
+        app.setStyleSheet(load_theme_qss("dark" if self._is_dark else "light"))
+        self._last_applied_theme = self._is_dark
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setApplicationName("Sports2D")  # names the per-user cache directory
     window = CustomStyleWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file